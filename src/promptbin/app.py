@@ -1,9 +1,14 @@
 from flask import Flask, render_template, request, jsonify
+import functools
+import html
 import os
 import re
+import threading
 import time
 import argparse
 import logging
+
+from markupsafe import Markup
 from dotenv import load_dotenv
 from .managers.prompt_manager import PromptManager
 from .managers.share_manager import ShareManager
@@ -17,8 +22,78 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     tomllib = None
 
+try:
+    import orjson  # optional, promptbin[server]
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+try:
+    from flask_compress import Compress  # optional, promptbin[server]
+except ModuleNotFoundError:  # pragma: no cover
+    Compress = None
+
 load_dotenv()
 
+# Precompiled patterns for hot paths (avoids per-call regex cache lookups)
+_TEMPLATE_VAR_RE = re.compile(r"\{\{([^}]+)\}\}")
+
+# Skip the preview cache for unusually large content to bound memory
+_PREVIEW_CACHE_MAX_CONTENT = 64 * 1024
+
+# Reused Markdown instances, one set per thread: markdown.markdown() would
+# rebuild the object and re-register every extension processor per call,
+# and Markdown's internal state is not reentrant across threads.
+_MD_LOCAL = threading.local()
+
+
+def _markdown_instance(attr: str, extensions: list) -> "markdown.Markdown":
+    md = getattr(_MD_LOCAL, attr, None)
+    if md is None:
+        md = markdown.Markdown(extensions=extensions)
+        setattr(_MD_LOCAL, attr, md)
+    # reset() is required between convert() calls to clear leftover state
+    md.reset()
+    return md
+
+
+def _highlight_template_vars(html_content: str) -> str:
+    """Wrap {{var}} tokens in highlight spans.
+
+    Each token is re-inserted verbatim, so plain str.replace over the
+    unique matches beats re.sub's replacement-template machinery on
+    variable-heavy prompts.
+    """
+    for var in set(_TEMPLATE_VAR_RE.findall(html_content)):
+        token = "{{" + var + "}}"
+        html_content = html_content.replace(
+            token, f'<span class="template-var">{token}</span>'
+        )
+    return html_content
+
+
+@functools.lru_cache(maxsize=256)
+def _render_preview(content: str) -> str:
+    """Render markdown preview HTML for the live editor.
+
+    Deliberately skips codehilite: Pygments lexing dominates server-side
+    render cost and the client already runs highlight.js on the fenced
+    <code class="language-xxx"> blocks. Cached so repeated identical
+    previews (keystroke pauses) skip the markdown pipeline entirely.
+    """
+    md = _markdown_instance("preview", ["fenced_code", "tables"])
+    return _highlight_template_vars(md.convert(content))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_preview_full(content: str) -> str:
+    """Render a full preview including server-side Pygments highlighting.
+
+    Used by the one-shot /api/preview/full endpoint, not the keystroke path.
+    """
+    md = _markdown_instance("full", ["codehilite", "fenced_code", "tables"])
+    return _highlight_template_vars(md.convert(content))
+
+
 # Global managers (will be initialized by init_app or main)
 share_manager = None
 prompt_manager = None
@@ -28,6 +103,26 @@ app_config = None  # Will hold PromptBinConfig instance
 # Create Flask app instance
 app = Flask(__name__, template_folder="web/templates", static_folder="web/static")
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson for faster (de)serialization
+        of the search and prompt-list responses"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+if Compress is not None:
+    # Compress the markdown preview and index HTML; highlighted markup
+    # and prompt listings compress to a fraction of their raw size
+    Compress(app)
+
 
 def init_app(config: Optional[PromptBinConfig] = None) -> Flask:
     """
@@ -82,6 +177,40 @@ def get_tunnel_manager():
     return tunnel_manager
 
 
+# Paths that benefit from conditional requests: the HTMX partials and
+# search results are re-fetched often but change only when prompts do
+_CONDITIONAL_PATHS = ("/htmx/", "/api/search")
+
+# flask-compress runs after this hook (after-request callbacks fire in
+# reverse registration order) and rewrites the outgoing ETag to
+# "<hash>:<algorithm>"; clients echo that suffixed value back, so the
+# suffix must be stripped from If-None-Match before comparing or no
+# conditional request would ever match once compression is active
+_COMPRESS_ETAG_SUFFIX_RE = re.compile(r':(?:gzip|br|deflate)(")')
+
+
+@app.after_request
+def add_conditional_etag(response):
+    """Attach an ETag to hot read endpoints so unchanged re-fetches
+    return 304 and the htmx swap becomes a no-op"""
+    if (
+        request.method == "GET"
+        and response.status_code == 200
+        and request.path.startswith(_CONDITIONAL_PATHS)
+        and not response.direct_passthrough
+    ):
+        response.add_etag()
+        if_none_match = request.environ.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and _COMPRESS_ETAG_SUFFIX_RE.search(if_none_match):
+            request.environ["HTTP_IF_NONE_MATCH"] = _COMPRESS_ETAG_SUFFIX_RE.sub(
+                r"\1", if_none_match
+            )
+            # Drop werkzeug's cached parse of the original header value
+            request.__dict__.pop("if_none_match", None)
+        return response.make_conditional(request)
+    return response
+
+
 # Add custom Jinja2 filter for regex operations
 @app.template_filter("regex_findall")
 def regex_findall_filter(text, pattern):
@@ -96,9 +225,6 @@ def regex_findall_filter(text, pattern):
 @app.template_filter("safe_highlight")
 def safe_highlight_filter(text):
     """Custom Jinja2 filter that only allows specific highlight markup"""
-    import html
-    from markupsafe import Markup
-
     if not text:
         return text
 
@@ -299,15 +425,15 @@ def update_prompt(prompt_id):
                 400,
             )
 
-        # Check if prompt exists
-        if not prompt_manager.get_prompt(prompt_id):
-            return (
-                jsonify({"status": "error", "message": "Prompt not found"}),
-                404,
-            )
-
-        prompt_manager.save_prompt(data, prompt_id)
+        # Single call: save_prompt raises KeyError for missing prompts,
+        # avoiding a separate existence read before the update
+        prompt_manager.save_prompt(data, prompt_id, require_exists=True)
         return jsonify({"status": "success", "message": "Prompt updated successfully"})
+    except KeyError:
+        return (
+            jsonify({"status": "error", "message": "Prompt not found"}),
+            404,
+        )
     except ValueError as e:
         return jsonify({"status": "error", "message": str(e)}), 400
     except Exception:
@@ -370,9 +496,8 @@ def search_prompts_json():
         return jsonify({"status": "error", "message": "Search failed"}), 500
 
 
-@app.route("/api/preview", methods=["POST"])
-def preview_content():
-    """API endpoint to preview prompt content with syntax highlighting
+def _preview_response(renderer):
+    """Shared request handling for the preview endpoints
     - handles both JSON and form data"""
     try:
         # Handle both JSON (for fetch requests) and form data (for HTMX)
@@ -411,19 +536,11 @@ def preview_content():
                     "</div>"
                 )
 
-        # Convert markdown to HTML
-        html_content = markdown.markdown(
-            content, extensions=["codehilite", "fenced_code", "tables"]
-        )
-
-        # Highlight template variables
-        import re
-
-        html_content = re.sub(
-            r"\{\{([^}]+)\}\}",
-            r'<span class="template-var">{{\1}}</span>',
-            html_content,
-        )
+        # Convert markdown to HTML (cached for repeated identical content)
+        if len(content) > _PREVIEW_CACHE_MAX_CONTENT:
+            html_content = renderer.__wrapped__(content)
+        else:
+            html_content = renderer(content)
 
         if return_json:
             return jsonify({"status": "success", "html": html_content})
@@ -444,6 +561,19 @@ def preview_content():
             )
 
 
+@app.route("/api/preview", methods=["POST"])
+def preview_content():
+    """API endpoint for the live editor preview (syntax highlighting is
+    deferred to highlight.js on the client)"""
+    return _preview_response(_render_preview)
+
+
+@app.route("/api/preview/full", methods=["POST"])
+def preview_content_full():
+    """API endpoint for a one-shot preview with server-side highlighting"""
+    return _preview_response(_render_preview_full)
+
+
 @app.route("/api/share/<prompt_id>", methods=["POST"])
 def create_share_link(prompt_id):
     """API endpoint to create a shareable link for a prompt"""
@@ -598,6 +728,38 @@ def internal_error(error):
     return render_template("500.html"), 500
 
 
+def serve(flask_app, host, port, debug=False):
+    """Serve the app with gunicorn threaded workers when available.
+
+    Gunicorn (optional dependency, ``promptbin[server]``) handles requests
+    concurrently so a slow preview render no longer stalls the HTMX
+    partials. Falls back to Flask's built-in dev server when gunicorn is
+    not installed (e.g. on Windows).
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ModuleNotFoundError:
+        flask_app.run(host=host, port=port, debug=debug, threaded=True)
+        return
+
+    class _GunicornApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            # Single worker: ShareManager holds share tokens and the
+            # tunnel rate-limit counters in memory, so a second process
+            # would miss tokens created in the first and double the
+            # per-IP attempt budget. Threads alone cover the concurrency
+            # this GIL-bound app needs.
+            self.cfg.set("workers", 1)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", 8)
+
+        def load(self):
+            return flask_app
+
+    _GunicornApplication().run()
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Run PromptBin Flask app")
     parser.add_argument("--host", default="127.0.0.1")
@@ -605,6 +767,11 @@ def parse_args():
     parser.add_argument(
         "--mode", choices=["standalone", "mcp-managed"], default="standalone"
     )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Flask's dev server (with debug) instead of gunicorn",
+    )
     parser.add_argument(
         "--log-level", default=os.environ.get("PROMPTBIN_LOG_LEVEL", "INFO")
     )
@@ -643,7 +810,15 @@ def main():
     # Debug mode only for standalone
     debug = args.mode != "mcp-managed"
 
-    app.run(host=config.flask_host, port=config.flask_port, debug=debug)
+    if args.dev:
+        app.run(
+            host=config.flask_host,
+            port=config.flask_port,
+            debug=debug,
+            threaded=True,
+        )
+    else:
+        serve(app, config.flask_host, config.flask_port, debug=debug)
 
 
 if __name__ == "__main__":
@@ -68,6 +68,11 @@ Examples:
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Logging level (default: INFO)",
     )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Serve the web interface with Flask's dev server instead of gunicorn",
+    )
 
     # Version
     parser.add_argument("--version", action="version", version="PromptBin 0.5.1")
@@ -77,7 +82,7 @@ Examples:
 
 def run_web_only(args):
     """Run only the web interface"""
-    from .app import init_app
+    from .app import init_app, serve
     from .core.config import PromptBinConfig
     import logging
 
@@ -106,7 +111,15 @@ def run_web_only(args):
 
     # Disable debug mode for MCP-managed subprocesses to prevent reloader issues
     debug_mode = not is_mcp_managed
-    app.run(host=config.flask_host, port=config.flask_port, debug=debug_mode)
+    if args.dev:
+        app.run(
+            host=config.flask_host,
+            port=config.flask_port,
+            debug=debug_mode,
+            threaded=True,
+        )
+    else:
+        serve(app, config.flask_host, config.flask_port, debug=debug_mode)
 
 
 def run_mcp_only(args):
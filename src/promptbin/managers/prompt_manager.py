@@ -1,29 +1,101 @@
 import json
+import mmap
 import os
 import re
 import sys
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson  # optional, promptbin[server]
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+# Logging configuration is left to the application entry points; library
+# code only emits records through its module logger
 logger = logging.getLogger(__name__)
 
 
+# Prompt files at or above this size are memory-mapped instead of read
+# into a fresh buffer; typical prompts stay well below it
+_MMAP_THRESHOLD = 64 * 1024
+
+# Cold scans with at least this many unparsed files warm the parse cache
+# with a thread pool (reads release the GIL); below it, pool setup costs
+# more than it saves
+_PARALLEL_PARSE_THRESHOLD = 32
+
+# Upper bound on entries in the parse and search-blob caches; the least
+# recently used entries are evicted beyond this, capping memory on very
+# large stores while keeping every prompt cached for typical ones
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _loads_prompt(data: bytes) -> Any:
+    """Parse prompt JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _bytes_prefilter(query_lower: str) -> Optional[bytes]:
+    """ASCII needle safe to search for in raw JSON bytes, or None.
+
+    A query containing quotes, backslashes or control characters may be
+    JSON-escaped on disk, and non-ASCII text defeats bytes-level
+    lowercasing, so those queries fall back to parse-then-match.
+    """
+    if not query_lower.isascii() or not query_lower.isprintable():
+        return None
+    if '"' in query_lower or "\\" in query_lower:
+        return None
+    return query_lower.encode("ascii")
+
+
+def _dumps_prompt(obj: Any) -> bytes:
+    """Serialize a prompt to compact JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 class PromptManager:
     """File-based storage manager for prompts"""
 
     VALID_CATEGORIES = ["coding", "writing", "analysis"]
-    WILDCARD_PATTERNS = ["*", "**"]
+    # Frozenset mirror for O(1) membership checks on hot paths; the list
+    # above keeps the stable ordering used for directories and messages
+    _VALID_CATEGORY_SET = frozenset(VALID_CATEGORIES)
+    WILDCARD_PATTERNS = frozenset(["*", "**"])
 
     def __init__(self, data_dir: Optional[str] = None):
         """Initialize the PromptManager and ensure directories exist"""
         self.PROMPTS_DIR = (
             Path(data_dir) if data_dir else Path(os.path.expanduser("~/promptbin-data"))
         )
+        # Mutation counter so callers can cheaply invalidate derived caches
+        self.version = 0
+        # Guards the two OrderedDict caches below: cache warming runs in
+        # a thread pool and the web server handles requests on threads,
+        # so hits (move_to_end) can race evictions (pop) without it
+        self._cache_lock = threading.Lock()
+        # Parsed-file cache: path -> ((mtime_ns, size), prompt dict).
+        # Re-listing a store of unchanged files costs one stat per file
+        # instead of an open+read+json.loads per file. Bounded to
+        # _CACHE_MAX_ENTRIES in LRU order.
+        self._parse_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # id -> path memo so repeat lookups skip the per-category probe
+        self._id_index: Dict[str, Path] = {}
+        # path -> (signature, lowercased searchable text) so repeated
+        # queries reject non-matching prompts with one substring check.
+        # Bounded like the parse cache.
+        self._blob_cache: "OrderedDict[str, tuple]" = OrderedDict()
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -31,12 +103,12 @@ class PromptManager:
         try:
             # First ensure the main data directory exists
             self.PROMPTS_DIR.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Ensured main data directory exists: {self.PROMPTS_DIR}")
+            logger.debug("Ensured main data directory exists: %s", self.PROMPTS_DIR)
 
             for category in self.VALID_CATEGORIES:
                 category_dir = self.PROMPTS_DIR / category
                 category_dir.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Ensured directory exists: {category_dir}")
+                logger.debug("Ensured directory exists: %s", category_dir)
         except PermissionError as e:
             error_msg = (
                 f"Permission denied creating directories at {self.PROMPTS_DIR}: {e}"
@@ -51,15 +123,16 @@ class PromptManager:
             logger.error(f"Error creating directories at {self.PROMPTS_DIR}: {e}")
             sys.exit(1)
 
-    def _generate_unique_id(self) -> str:
+    def _generate_unique_id(self, now: Optional[datetime] = None) -> str:
         """Generate a unique ID for a new prompt"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_suffix = str(uuid.uuid4())[:8]
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        # uuid4().hex skips building the dashed string form just to slice it
+        random_suffix = uuid.uuid4().hex[:8]
         return f"{timestamp}_{random_suffix}"
 
     def _validate_category(self, category: str) -> None:
         """Validate that category is allowed"""
-        if category not in self.VALID_CATEGORIES:
+        if category not in self._VALID_CATEGORY_SET:
             raise ValueError(
                 f"Invalid category '{category}'. "
                 f"Must be one of: {self.VALID_CATEGORIES}"
@@ -85,40 +158,134 @@ class PromptManager:
 
     def _find_prompt_file(self, prompt_id: str) -> Optional[Path]:
         """Find a prompt file by ID across all categories"""
+        cached = self._id_index.get(prompt_id)
+        if cached is not None:
+            # Verify against the filesystem: the file may have been moved
+            # or deleted by another process
+            if cached.exists():
+                return cached
+            del self._id_index[prompt_id]
+
         for category in self.VALID_CATEGORIES:
             prompt_path = self._get_prompt_path(prompt_id, category)
             if prompt_path.exists():
+                self._id_index[prompt_id] = prompt_path
                 return prompt_path
         return None
 
-    def save_prompt(self, data: Dict[str, Any], prompt_id: Optional[str] = None) -> str:
+    def _read_prompt_file(
+        self,
+        path: Path,
+        stat_result: Optional[os.stat_result] = None,
+        raw: Optional[bytes] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Read and parse a single prompt file, served from the parse
+        cache when the file is unchanged on disk.
+
+        All prompt reads funnel through here so listing, search and
+        lookup share one code path (and one place to optimize). Callers
+        that already hold the file's bytes (e.g. the search prefilter)
+        pass them via ``raw`` to skip the second disk read.
+        """
+        key = str(path)
+        try:
+            if stat_result is None:
+                stat_result = os.stat(path)
+        except OSError as e:
+            logger.error(f"Error reading prompt file {path}: {e}")
+            with self._cache_lock:
+                self._parse_cache.pop(key, None)
+            return None
+
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._parse_cache.move_to_end(key)
+                return cached[1]
+
+        try:
+            # One buffered read of the whole file, parsed straight from
+            # UTF-8 bytes without the text-decoding wrapper. Unusually
+            # large files are memory-mapped to avoid the copy.
+            if raw is not None:
+                data = _loads_prompt(raw)
+            elif stat_result.st_size >= _MMAP_THRESHOLD:
+                with open(path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = _loads_prompt(
+                            memoryview(mm) if orjson is not None else mm[:]
+                        )
+            else:
+                data = _loads_prompt(path.read_bytes())
+        except Exception as e:
+            logger.error(f"Error reading prompt file {path}: {e}")
+            return None
+
+        with self._cache_lock:
+            self._parse_cache[key] = (signature, data)
+            self._parse_cache.move_to_end(key)
+            if len(self._parse_cache) > _CACHE_MAX_ENTRIES:
+                self._parse_cache.popitem(last=False)
+        # A (re-)parse means the file changed on disk - possibly written
+        # by another process - so derived caches must refresh too
+        self.version += 1
+        return data
+
+    @staticmethod
+    def _parse_tags(raw) -> List[str]:
+        """Normalize a comma-separated tag string (or pre-split list)
+        into a list of non-empty tags, stripping each tag once"""
+        if isinstance(raw, list):
+            return [t for t in (tag.strip() for tag in raw) if t]
+        return [t for t in (tag.strip() for tag in raw.split(",")) if t]
+
+    def save_prompt(
+        self,
+        data: Dict[str, Any],
+        prompt_id: Optional[str] = None,
+        require_exists: bool = False,
+    ) -> str:
         """
         Save a prompt to file storage
 
         Args:
             data: Prompt data dictionary
             prompt_id: Optional existing prompt ID for updates
+            require_exists: If True, raise KeyError when updating a
+                prompt that does not exist (avoids a separate existence
+                check and read by the caller)
 
         Returns:
             The prompt ID
+
+        Raises:
+            KeyError: If require_exists is True and prompt_id is not found
         """
         try:
             # Validate input data
             self._validate_prompt_data(data)
 
+            # Single timestamp per save, shared by the generated ID and
+            # the created_at/updated_at fields
+            now_dt = datetime.now()
+            now = now_dt.isoformat()
+
             # Generate ID if creating new prompt
             if prompt_id is None:
-                prompt_id = self._generate_unique_id()
+                prompt_id = self._generate_unique_id(now_dt)
                 is_new = True
             else:
                 is_new = False
 
-            # Prepare prompt data
-            now = datetime.now().isoformat()
-
-            # If updating existing prompt, preserve created_at
+            # If updating existing prompt, locate the current file once;
+            # it supplies both created_at and the old category below
+            old_path = None
             if not is_new:
-                existing_prompt = self.get_prompt(prompt_id)
+                old_path = self._find_prompt_file(prompt_id)
+                if old_path is None and require_exists:
+                    raise KeyError(f"Prompt not found: {prompt_id}")
+                existing_prompt = self._read_prompt_file(old_path) if old_path else None
                 created_at = (
                     existing_prompt.get("created_at", now) if existing_prompt else now
                 )
@@ -131,37 +298,46 @@ class PromptManager:
                 "content": data["content"],
                 "category": data["category"],
                 "description": data.get("description", "").strip(),
-                "tags": [
-                    tag.strip()
-                    for tag in data.get("tags", "").split(",")
-                    if tag.strip()
-                ],
+                "tags": self._parse_tags(data.get("tags", "")),
                 "created_at": created_at,
                 "updated_at": now,
             }
 
             # Handle category change for existing prompts
-            if not is_new:
-                old_path = self._find_prompt_file(prompt_id)
-                if old_path:
-                    old_category = old_path.parent.name
-                    if old_category != data["category"]:
-                        # Remove old file when category changes
-                        old_path.unlink()
-                        logger.info(
-                            f"Moved prompt {prompt_id} from {old_category} "
-                            f"to {data['category']}"
-                        )
+            if old_path is not None:
+                old_category = old_path.parent.name
+                if old_category != data["category"]:
+                    # Remove old file when category changes
+                    old_path.unlink()
+                    with self._cache_lock:
+                        self._parse_cache.pop(str(old_path), None)
+                        self._blob_cache.pop(str(old_path), None)
+                    logger.debug(
+                        "Moved prompt %s from %s to %s",
+                        prompt_id,
+                        old_category,
+                        data["category"],
+                    )
 
             # Write to new location
             prompt_path = self._get_prompt_path(prompt_id, data["category"])
 
-            with open(prompt_path, "w", encoding="utf-8") as f:
-                json.dump(prompt_data, f, indent=2, ensure_ascii=False)
+            # Write to a sibling temp file and os.replace it into place so
+            # readers (including other processes) never see a partial file
+            tmp_path = prompt_path.with_name(prompt_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps_prompt(prompt_data))
+            os.replace(tmp_path, prompt_path)
+            self._id_index[prompt_id] = prompt_path
 
-            logger.info(f"{'Created' if is_new else 'Updated'} prompt {prompt_id}")
+            self.version += 1
+            logger.debug("%s prompt %s", "Created" if is_new else "Updated", prompt_id)
             return prompt_id
 
+        except KeyError:
+            # Expected when require_exists is set and the ID is unknown;
+            # the caller turns it into a 404, so it is not a storage error
+            raise
         except Exception as e:
             logger.error(f"Error saving prompt: {e}")
             raise
@@ -181,53 +357,114 @@ class PromptManager:
             if not prompt_path:
                 return None
 
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self._read_prompt_file(prompt_path)
 
         except Exception as e:
             logger.error(f"Error retrieving prompt {prompt_id}: {e}")
             return None
 
-    def list_prompts(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    def iter_prompts(self, category: Optional[str] = None):
         """
-        List all prompts, optionally filtered by category
+        Lazily yield prompts, optionally filtered by category
+
+        Yields prompts in unspecified order as each file is read, so
+        callers scanning for a single match can stop early without
+        paying for the remaining files. Use list_prompts for the
+        sorted listing.
 
         Args:
             category: Optional category to filter by
 
-        Returns:
-            List of prompt data dictionaries
+        Yields:
+            Prompt data dictionaries
         """
-        prompts = []
+        for path, stat_result in self._scan_entries(category):
+            prompt_data = self._read_prompt_file(path, stat_result=stat_result)
+            if prompt_data is not None:
+                yield prompt_data
+            else:
+                logger.warning(f"Skipping invalid prompt data in {path}")
 
-        try:
-            categories = [category] if category else self.VALID_CATEGORIES
+    def store_fingerprint(self) -> tuple:
+        """Cheap fingerprint of the on-disk store: the mtime of each
+        category directory.
 
-            for cat in categories:
-                if category and cat != category:
-                    continue
+        Creating, replacing (os.replace) or deleting a prompt file
+        updates its directory's mtime, including writes made by another
+        process, so callers can validate caches against this without
+        scanning any prompt files.
+        """
+        fingerprint = []
+        for category in self.VALID_CATEGORIES:
+            try:
+                fingerprint.append(os.stat(self.PROMPTS_DIR / category).st_mtime_ns)
+            except OSError:
+                fingerprint.append(0)
+        return tuple(fingerprint)
 
-                self._validate_category(cat)
-                category_dir = self.PROMPTS_DIR / cat
+    def _scan_entries(self, category: Optional[str] = None):
+        """Yield (path, stat_result) for every prompt file on disk.
 
-                if not category_dir.exists():
-                    continue
+        os.scandir yields name, type and stat info from one pass over
+        the directory, where glob+stat would re-stat each file.
+        """
+        categories = [category] if category else self.VALID_CATEGORIES
+
+        for cat in categories:
+            self._validate_category(cat)
+            category_dir = self.PROMPTS_DIR / cat
 
-                for json_file in category_dir.glob("*.json"):
+            if not category_dir.exists():
+                continue
+
+            with os.scandir(category_dir) as entries:
+                for entry in entries:
                     try:
-                        with open(json_file, "r", encoding="utf-8") as f:
-                            prompt_data = json.load(f)
-                            if prompt_data is not None:
-                                prompts.append(prompt_data)
-                            else:
-                                logger.warning(
-                                    f"Skipping invalid prompt data (None) "
-                                    f"in {json_file}"
-                                )
-                    except Exception as e:
-                        logger.error(f"Error reading prompt file {json_file}: {e}")
+                        if entry.name.endswith(".json") and entry.is_file():
+                            yield Path(entry.path), entry.stat()
+                    except OSError as e:
+                        # File deleted between readdir and stat (e.g. by
+                        # the web subprocess); skip it, not the listing
+                        logger.warning(f"Skipping unreadable entry {entry.path}: {e}")
                         continue
 
+    def list_prompts(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List all prompts, optionally filtered by category
+
+        Args:
+            category: Optional category to filter by
+
+        Returns:
+            List of prompt data dictionaries
+        """
+        try:
+            entries = list(self._scan_entries(category))
+
+            # Warm the parse cache in parallel when enough files are cold;
+            # file reads release the GIL, so the pool overlaps the I/O
+            cold = [
+                (path, st)
+                for path, st in entries
+                if (cached := self._parse_cache.get(str(path))) is None
+                or cached[0] != (st.st_mtime_ns, st.st_size)
+            ]
+            if len(cold) >= _PARALLEL_PARSE_THRESHOLD:
+                workers = min(8, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(
+                        executor.map(
+                            lambda item: self._read_prompt_file(item[0], item[1]),
+                            cold,
+                        )
+                    )
+
+            prompts = [
+                data
+                for path, st in entries
+                if (data := self._read_prompt_file(path, stat_result=st)) is not None
+            ]
+
             # Sort by updated_at (most recent first)
             prompts.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
 
@@ -253,7 +490,12 @@ class PromptManager:
                 return False
 
             prompt_path.unlink()
-            logger.info(f"Deleted prompt {prompt_id}")
+            with self._cache_lock:
+                self._parse_cache.pop(str(prompt_path), None)
+                self._blob_cache.pop(str(prompt_path), None)
+            self._id_index.pop(prompt_id, None)
+            self.version += 1
+            logger.debug("Deleted prompt %s", prompt_id)
             return True
 
         except Exception as e:
@@ -276,17 +518,47 @@ class PromptManager:
         if not query.strip():
             return self.list_prompts(category)
 
+        query_lower = query.lower().strip()
+
+        # Handle wildcard searches
+        if query_lower in self.WILDCARD_PATTERNS:
+            return self.list_prompts(category)
+
         try:
-            all_prompts = self.list_prompts(category)
+            # For safe ASCII queries, cold files are screened with a
+            # C-level bytes scan before any JSON parsing: a prompt whose
+            # raw bytes lack the needle cannot match in any field
+            needle = _bytes_prefilter(query_lower)
             matching_prompts = []
 
-            query_lower = query.lower().strip()
+            for path, st in self._scan_entries(category):
+                key = str(path)
+                signature = (st.st_mtime_ns, st.st_size)
+                cached = self._parse_cache.get(key)
+                if cached is not None and cached[0] == signature:
+                    prompt = cached[1]
+                elif needle is not None:
+                    try:
+                        raw = path.read_bytes()
+                    except OSError as e:
+                        logger.error(f"Error reading prompt file {path}: {e}")
+                        continue
+                    if needle not in raw.lower():
+                        continue  # cannot match; skip the parse entirely
+                    prompt = self._read_prompt_file(path, stat_result=st, raw=raw)
+                    if prompt is None:
+                        continue
+                else:
+                    prompt = self._read_prompt_file(path, stat_result=st)
+                    if prompt is None:
+                        continue
 
-            # Handle wildcard searches
-            if query_lower in self.WILDCARD_PATTERNS:
-                return all_prompts
+                # One substring check against the cached lowercase blob
+                # rejects non-matches before the per-field lowering and
+                # snippet work in _find_search_matches
+                if query_lower not in self._search_blob(key, signature, prompt):
+                    continue
 
-            for prompt in all_prompts:
                 prompt_copy = prompt.copy()
                 match_info = self._find_search_matches(prompt_copy, query_lower)
 
@@ -295,12 +567,38 @@ class PromptManager:
                     prompt_copy["_search_highlights"] = match_info
                     matching_prompts.append(prompt_copy)
 
+            # Keep the most-recent-first ordering of list_prompts
+            matching_prompts.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
+
             return matching_prompts
 
         except Exception as e:
             logger.error(f"Error searching prompts: {e}")
             return []
 
+    def _search_blob(self, key: str, signature: tuple, prompt: Dict[str, Any]) -> str:
+        """Lowercased concatenation of a prompt's searchable fields,
+        cached per file signature"""
+        with self._cache_lock:
+            cached = self._blob_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._blob_cache.move_to_end(key)
+                return cached[1]
+
+        blob = "\n".join(
+            (
+                prompt.get("title", ""),
+                prompt.get("description", ""),
+                prompt.get("content", ""),
+                " ".join(prompt.get("tags", [])),
+            )
+        ).lower()
+        with self._cache_lock:
+            self._blob_cache[key] = (signature, blob)
+            if len(self._blob_cache) > _CACHE_MAX_ENTRIES:
+                self._blob_cache.popitem(last=False)
+        return blob
+
     def _find_search_matches(
         self, prompt: Dict[str, Any], query_lower: str
     ) -> Dict[str, Any]:
@@ -396,39 +694,34 @@ class PromptManager:
         try:
             stats = {
                 "total_prompts": 0,
-                "by_category": {},
+                "by_category": {category: 0 for category in self.VALID_CATEGORIES},
                 "total_tags": set(),
                 "recent_activity": [],
             }
 
-            for category in self.VALID_CATEGORIES:
-                prompts = self.list_prompts(category)
-                stats["by_category"][category] = len(prompts)
-                stats["total_prompts"] += len(prompts)
-
-                for prompt in prompts:
-                    if prompt is None:
-                        logger.warning(
-                            f"Found None prompt in category {category} - "
-                            f"possible data integrity issue"
-                        )
-                        continue
-                    # Collect unique tags
-                    stats["total_tags"].update(prompt.get("tags", []))
-
-                    # Track recent activity (last 10) - safely get required fields
-                    if all(
-                        key in prompt
-                        for key in ["id", "title", "category", "updated_at"]
-                    ):
-                        stats["recent_activity"].append(
-                            {
-                                "id": prompt["id"],
-                                "title": prompt["title"],
-                                "category": prompt["category"],
-                                "updated_at": prompt["updated_at"],
-                            }
-                        )
+            # Single pass over the store instead of one listing per
+            # category (which re-walked every directory three times)
+            for prompt in self.iter_prompts():
+                category = prompt.get("category")
+                if category in stats["by_category"]:
+                    stats["by_category"][category] += 1
+                stats["total_prompts"] += 1
+
+                # Collect unique tags
+                stats["total_tags"].update(prompt.get("tags", []))
+
+                # Track recent activity (last 10) - safely get required fields
+                if all(
+                    key in prompt for key in ["id", "title", "category", "updated_at"]
+                ):
+                    stats["recent_activity"].append(
+                        {
+                            "id": prompt["id"],
+                            "title": prompt["title"],
+                            "category": prompt["category"],
+                            "updated_at": prompt["updated_at"],
+                        }
+                    )
 
             # Sort recent activity and limit to 10
             stats["recent_activity"] = sorted(
@@ -8,10 +8,12 @@ the Flask web interface lifecycle.
 """
 
 import asyncio
+import functools
 import logging
 import re
 import signal
 import sys
+from itertools import islice
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
 from mcp.server.fastmcp import FastMCP
@@ -21,6 +23,41 @@ from ..core.config import PromptBinConfig
 if TYPE_CHECKING:
     pass
 
+# Precompiled patterns for template-variable extraction and title sanitization
+# (avoids the per-call regex cache probe on hot MCP request paths)
+_TEMPLATE_VAR_NAME_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Single-pass title sanitization: one pattern matches every run of
+# characters that either gets deleted (punctuation) or collapsed to a
+# dash (whitespace/underscore/dash); the replacement decides which.
+_SANITIZE_RE = re.compile(r"[\W_]+")
+_SANITIZE_SEP_CHAR_RE = re.compile(r"[\s_-]")
+
+
+def _sanitize_replacement(match: "re.Match") -> str:
+    return "-" if _SANITIZE_SEP_CHAR_RE.search(match.group()) else ""
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_template_variables_cached(content: str) -> tuple:
+    """Unique {{variable}} names in content, in order of first appearance.
+
+    Cached (and returning an immutable tuple) because the same content is
+    re-scanned whenever a prompt is listed, searched or fetched.
+    """
+    return tuple(dict.fromkeys(_TEMPLATE_VAR_NAME_RE.findall(content)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _content_stats_cached(content: str) -> tuple:
+    """(word_count, token_count, template_variables) for content"""
+    word_count = len(content.split())
+    return (
+        word_count,
+        (word_count * 13) // 10,
+        _extract_template_variables_cached(content),
+    )
+
 
 class PromptBinMCPServer:
     """MCP server for PromptBin with Flask subprocess management"""
@@ -41,6 +78,15 @@ class PromptBinMCPServer:
         self.is_running = False
         self.flask_manager = None
 
+        # Sanitized-title -> id index for name-based prompt lookup,
+        # invalidated via the PromptManager mutation counter
+        self._name_index: Dict[str, str] = {}
+        self._name_index_version = -1
+
+        # Cached list-prompts payload, keyed on the same mutation counter;
+        # prompts are listed far more often than they change
+        self._list_cache: Optional[tuple] = None
+
         # Set up logging
         self._setup_logging()
         self.logger = logging.getLogger(__name__)
@@ -55,7 +101,8 @@ class PromptBinMCPServer:
         self._setup_flask_manager()
 
         self.logger.info("PromptBin MCP Server initialized")
-        self.logger.debug(f"Configuration: {self._safe_config_log()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Configuration: %s", self._safe_config_log())
 
     def _setup_flask_manager(self):
         """Setup Flask manager (but don't start yet)"""
@@ -72,7 +119,7 @@ class PromptBinMCPServer:
             )
             self.logger.info("Flask manager configured")
         except Exception as e:
-            self.logger.error(f"Error setting up Flask manager: {e}")
+            self.logger.error("Error setting up Flask manager: %s", e)
 
     def _load_default_config(self) -> "PromptBinConfig":
         """Load default configuration (deprecated - kept for backward compatibility)"""
@@ -97,7 +144,7 @@ class PromptBinMCPServer:
         """Set up signal handlers for graceful shutdown"""
 
         def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
+            self.logger.info("Received signal %s, initiating shutdown...", signum)
             # Set flag to trigger shutdown in main loop instead of creating async task
             self.is_running = False
 
@@ -114,11 +161,7 @@ class PromptBinMCPServer:
         """Extract template variables from content using {{variable}} pattern"""
         if not content:
             return []
-
-        # Find all {{variable}} patterns and extract variable names
-        matches = re.findall(r"\{\{(\w+)\}\}", content)
-        # Return unique variable names, preserving order
-        return list(dict.fromkeys(matches))
+        return list(_extract_template_variables_cached(content))
 
     def _calculate_content_stats(self, content: str) -> Dict[str, Any]:
         """Calculate content statistics including word count and token estimation"""
@@ -129,20 +172,12 @@ class PromptBinMCPServer:
                 "template_variables": [],
             }
 
-        # Calculate word count (split on whitespace and count non-empty strings)
-        words = [word for word in content.split() if word.strip()]
-        word_count = len(words)
-
-        # Token estimation using industry standard approximation
-        token_count = int(word_count * 1.3)
-
-        # Extract template variables
-        template_variables = self._extract_template_variables(content)
+        word_count, token_count, template_variables = _content_stats_cached(content)
 
         return {
             "word_count": word_count,
             "token_count": token_count,
-            "template_variables": template_variables,
+            "template_variables": list(template_variables),
         }
 
     def _format_prompt_for_mcp(self, prompt_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -170,6 +205,46 @@ class PromptBinMCPServer:
             },
         }
 
+    def _sanitize_title(self, title: str) -> str:
+        """Sanitize a title: lowercase, replace spaces/special chars with dashes"""
+        return _SANITIZE_RE.sub(_sanitize_replacement, title.lower()).strip("-")
+
+    def _scan_for_name(self, key: str) -> Optional[str]:
+        """Linear-scan fallback for names missing from the cached index"""
+        # Cheap C-level substring prefilter: the first word-run of the
+        # target almost always survives sanitization verbatim, so titles
+        # that don't contain it can skip the regex work entirely.
+        needle = key.lstrip("-").split("-", 1)[0]
+        for prompt in self.prompt_manager.iter_prompts():
+            title = prompt.get("title", "")
+            if not title:
+                continue
+            if needle and needle not in title.lower():
+                continue
+            if self._sanitize_title(title) == key:
+                return prompt.get("id")
+
+        # Sanitization deletes characters (e.g. "Foo!Bar" -> "foobar"),
+        # which the substring prefilter cannot see; one unfiltered pass
+        # on the not-found path keeps resolution exact.
+        if needle:
+            for prompt in self.prompt_manager.iter_prompts():
+                title = prompt.get("title", "")
+                if title and self._sanitize_title(title) == key:
+                    return prompt.get("id")
+        return None
+
+    def _refresh_name_index(self) -> Dict[str, str]:
+        """Rebuild the sanitized-title -> id index from the prompt store"""
+        index = {}
+        for prompt in self.prompt_manager.list_prompts():
+            title = prompt.get("title", "")
+            if title:
+                index[self._sanitize_title(title)] = prompt.get("id")
+        self._name_index = index
+        self._name_index_version = self.prompt_manager.version
+        return index
+
     def _resolve_prompt_name(self, name: str) -> Optional[str]:
         """Convert prompt name to ID, supporting both ID and sanitized title lookup"""
         if not name:
@@ -179,21 +254,21 @@ class PromptBinMCPServer:
         if self.prompt_manager.get_prompt(name):
             return name
 
-        # If not found as ID, try name-based lookup
-        all_prompts = self.prompt_manager.list_prompts()
+        # If not found as ID, try name-based lookup via the cached index
+        if self._name_index_version != self.prompt_manager.version:
+            self._refresh_name_index()
 
-        # Create sanitized name from title for comparison
-        for prompt in all_prompts:
-            title = prompt.get("title", "")
-            if title:
-                # Sanitize title: lowercase, replace spaces/special chars with dashes
-                sanitized_title = re.sub(r"[^\w\s-]", "", title.lower())
-                sanitized_title = re.sub(r"[\s_-]+", "-", sanitized_title).strip("-")
-
-                if sanitized_title == name.lower():
-                    return prompt.get("id")
+        key = name.lower()
+        prompt_id = self._name_index.get(key)
+        if prompt_id is None:
+            # The web interface mutates the store out-of-process, so a miss
+            # may just mean the index is stale; rescan for this name and
+            # memoize a hit for subsequent lookups.
+            prompt_id = self._scan_for_name(key)
+            if prompt_id:
+                self._name_index[key] = prompt_id
 
-        return None
+        return prompt_id
 
     def _register_mcp_handlers(self):
         """Register MCP protocol handlers with FastMCP"""
@@ -202,16 +277,29 @@ class PromptBinMCPServer:
         def list_all_prompts() -> Dict[str, Any]:
             """List all available prompts with metadata"""
             try:
+                # The web interface writes prompts from its own process,
+                # where our version counter never moves, so validate hits
+                # against the on-disk store fingerprint as well
+                key = (
+                    self.prompt_manager.version,
+                    self.prompt_manager.store_fingerprint(),
+                )
+                if self._list_cache is not None and self._list_cache[0] == key:
+                    return self._list_cache[1]
+
                 prompts = self.prompt_manager.list_prompts()
                 formatted_prompts = [self._format_prompt_for_mcp(p) for p in prompts]
 
-                self.logger.debug(f"Listed {len(formatted_prompts)} prompts")
-                return {
+                payload = {
                     "prompts": formatted_prompts,
                     "total_count": len(formatted_prompts),
                 }
+                self._list_cache = (key, payload)
+
+                self.logger.debug("Listed %d prompts", len(formatted_prompts))
+                return payload
             except Exception as e:
-                self.logger.error(f"Error listing prompts: {e}")
+                self.logger.error("Error listing prompts: %s", e)
                 raise ValueError(f"Failed to list prompts: {str(e)}")
 
         @self.mcp.resource("promptbin://get-prompt/{prompt_id}")
@@ -228,11 +316,11 @@ class PromptBinMCPServer:
                     raise ValueError(f"Prompt not found: {prompt_id}")
 
                 formatted_prompt = self._format_prompt_for_mcp(prompt)
-                self.logger.debug(f"Retrieved prompt: {prompt_id}")
+                self.logger.debug("Retrieved prompt: %s", prompt_id)
                 return formatted_prompt
 
             except Exception as e:
-                self.logger.error(f"Error getting prompt {prompt_id}: {e}")
+                self.logger.error("Error getting prompt %s: %s", prompt_id, e)
                 raise ValueError(f"Failed to get prompt {prompt_id}: {str(e)}")
 
         @self.mcp.tool()
@@ -257,7 +345,9 @@ class PromptBinMCPServer:
                 formatted_results = [self._format_prompt_for_mcp(p) for p in results]
 
                 self.logger.debug(
-                    f"Search query '{query}' returned {len(formatted_results)} results"
+                    "Search query '%s' returned %d results",
+                    query,
+                    len(formatted_results),
                 )
                 return {
                     "results": formatted_results,
@@ -268,7 +358,9 @@ class PromptBinMCPServer:
                 }
 
             except Exception as e:
-                self.logger.error(f"Error searching prompts with query '{query}': {e}")
+                self.logger.error(
+                    "Error searching prompts with query '%s': %s", query, e
+                )
                 raise ValueError(f"Search failed: {str(e)}")
 
         # Additional resource for name-based access (protocol URL support)
@@ -279,15 +371,14 @@ class PromptBinMCPServer:
                 # This is an alias for get_single_prompt with explicit name resolution
                 resolved_id = self._resolve_prompt_name(name)
                 if not resolved_id:
-                    # Try to find similar names for helpful error message
-                    all_prompts = self.prompt_manager.list_prompts()
-                    available_names = []
-                    for p in all_prompts[:5]:  # Show first 5 as examples
-                        title = p.get("title", "")
-                        if title:
-                            sanitized = re.sub(r"[^\w\s-]", "", title.lower())
-                            sanitized = re.sub(r"[\s_-]+", "-", sanitized).strip("-")
-                            available_names.append(sanitized)
+                    # Offer example names in the error message; prefer the
+                    # cached name index over re-scanning the whole store
+                    available_names = list(islice(self._name_index, 5))
+                    if not available_names:
+                        for p in islice(self.prompt_manager.list_prompts(), 5):
+                            title = p.get("title", "")
+                            if title:
+                                available_names.append(self._sanitize_title(title))
 
                     error_msg = f"Prompt '{name}' not found."
                     if available_names:
@@ -300,11 +391,13 @@ class PromptBinMCPServer:
                     raise ValueError(f"Prompt not found: {name}")
 
                 formatted_prompt = self._format_prompt_for_mcp(prompt)
-                self.logger.debug(f"Retrieved prompt by name: {name} -> {resolved_id}")
+                self.logger.debug(
+                    "Retrieved prompt by name: %s -> %s", name, resolved_id
+                )
                 return formatted_prompt
 
             except Exception as e:
-                self.logger.error(f"Error getting prompt by name '{name}': {e}")
+                self.logger.error("Error getting prompt by name '%s': %s", name, e)
                 raise ValueError(f"Failed to get prompt '{name}': {str(e)}")
 
         @self.mcp.resource("promptbin://flask-status")
@@ -315,7 +408,7 @@ class PromptBinMCPServer:
                     status = self.flask_manager.flask_status()
                 return status
             except Exception as e:
-                self.logger.error(f"Error getting Flask status: {e}")
+                self.logger.error("Error getting Flask status: %s", e)
                 return {"error": str(e)}
 
         self.logger.info("MCP protocol handlers registered successfully")
@@ -341,10 +434,10 @@ class PromptBinMCPServer:
             self.logger.info("MCP Server shutdown complete")
 
         except Exception as e:
-            self.logger.error(f"Error during shutdown: {e}")
+            self.logger.error("Error during shutdown: %s", e)
             import traceback
 
-            self.logger.debug(f"Shutdown error traceback: {traceback.format_exc()}")
+            self.logger.debug("Shutdown error traceback: %s", traceback.format_exc())
             raise
 
 
@@ -100,11 +100,9 @@ class FlaskManager:
                 env=env,
             )
 
-        # Give Flask more time to start up before health checking
-        await asyncio.sleep(5)
-
-        # Wait for health
-        ready = await self._wait_until_healthy(timeout=30)
+        # Poll for health immediately; _wait_until_healthy returns as soon
+        # as the subprocess answers, so no fixed startup sleep is needed
+        ready = await self._wait_until_healthy(timeout=35)
         if not ready:
             self._logger.error("Flask failed to become healthy in time")
             raise RuntimeError("Flask did not become healthy")
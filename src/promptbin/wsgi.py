@@ -0,0 +1,16 @@
+"""
+WSGI entry point for PromptBin.
+
+Exposes a module-level ``application`` for production WSGI servers, e.g.:
+
+    gunicorn -w 1 -k gthread --threads 8 -b 127.0.0.1:5000 promptbin.wsgi:application
+
+Keep a single worker: share tokens and tunnel rate-limit counters live
+in process memory and are not shared between workers.
+
+Configuration is read from the environment (see PromptBinConfig).
+"""
+
+from .app import init_app
+
+application = init_app()
@@ -0,0 +1,50 @@
+from promptbin.app import init_app
+from promptbin.core.config import PromptBinConfig
+
+
+def make_client(tmp_path):
+    config = PromptBinConfig(data_dir=str(tmp_path / "test-prompts"))
+    app = init_app(config)
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def test_conditional_refetch_returns_304(tmp_path):
+    client = make_client(tmp_path)
+
+    first = client.get("/htmx/index", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    etag = first.headers.get("ETag")
+    assert etag
+
+    # Echo the ETag exactly as served (flask-compress, when installed,
+    # suffixes it with the compression algorithm) and expect a 304
+    second = client.get(
+        "/htmx/index",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert second.status_code == 304
+
+
+def test_conditional_refetch_with_compress_suffixed_etag(tmp_path):
+    client = make_client(tmp_path)
+
+    first = client.get("/htmx/index")
+    etag = first.headers.get("ETag")
+    assert etag
+
+    # Simulate a client that cached the ETag as rewritten by
+    # flask-compress ("<hash>:gzip"); the suffix must not defeat the
+    # conditional comparison
+    suffixed = etag.rstrip('"') + ':gzip"'
+    second = client.get("/htmx/index", headers={"If-None-Match": suffixed})
+    assert second.status_code == 304
+
+
+def test_unconditional_or_stale_etag_returns_200(tmp_path):
+    client = make_client(tmp_path)
+
+    assert client.get("/htmx/index").status_code == 200
+
+    stale = client.get("/htmx/index", headers={"If-None-Match": '"stale:gzip"'})
+    assert stale.status_code == 200
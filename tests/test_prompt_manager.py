@@ -66,6 +66,30 @@ def test_list_and_delete_prompt(tmp_path, monkeypatch):
     assert pm.get_prompt(id1) is None
 
 
+def test_parse_cache_reflects_external_changes(tmp_path, monkeypatch):
+    pm = make_pm(tmp_path, monkeypatch)
+
+    prompt_id = pm.save_prompt(
+        {
+            "title": "Cached",
+            "content": "original",
+            "category": "coding",
+            "tags": "",
+        }
+    )
+
+    # Warm the cache, then rewrite the file out-of-band (as the web
+    # subprocess would) and verify the change is picked up
+    assert pm.get_prompt(prompt_id)["content"] == "original"
+
+    path = tmp_path / "test-prompts" / "coding" / f"{prompt_id}.json"
+    data = json.loads(path.read_text("utf-8"))
+    data["content"] = "modified externally"
+    path.write_text(json.dumps(data), "utf-8")
+
+    assert pm.get_prompt(prompt_id)["content"] == "modified externally"
+
+
 def test_search_prompts(tmp_path, monkeypatch):
     pm = make_pm(tmp_path, monkeypatch)
 